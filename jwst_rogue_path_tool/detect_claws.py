@@ -43,9 +43,11 @@ from jwst_rogue_path_tool.plotting import (
 )
 from jwst_rogue_path_tool.utils import (
     calculate_background,
+    get_catalog_trig,
     get_pupil_from_filter,
     get_pivot_wavelength,
     make_output_directory,
+    unit_vectors_from_v2v3,
 )
 
 
@@ -611,6 +613,16 @@ class exposureFrames:
 
         self.catalog = pd.read_csv(full_catalog_path)
 
+        # Contiguous copies of the catalog positions, reused by the angle
+        # sweep and the plotting routines.
+        self.catalog_ra = np.ascontiguousarray(
+            self.catalog["ra"].to_numpy(dtype=np.float64)
+        )
+        self.catalog_dec = np.ascontiguousarray(
+            self.catalog["dec"].to_numpy(dtype=np.float64)
+        )
+        self.catalog_trig = get_catalog_trig(self.catalog_ra, self.catalog_dec)
+
     def build_exposure_frames_data(self):
         """Use exposure table to separate data into exposure frame specific
         pandas dataframes. Resetting the index to combinations of exposure and
@@ -724,14 +736,31 @@ class exposureFrames:
         self.observation["valid_ends_angles"] = (ends - 0.5) * self.angular_step
 
     def calculate_attitude(self, v3pa):
-        """Calculate attitude matrix given V3 position angle.
+        """Calculate attitude matrix given V3 position angle and store it
+        as `self.attitude`.
 
         Parameters
         ----------
         v3pa : float
             V3 position angle
         """
-        self.attitude = rotations.attitude(
+        self.attitude = self.compute_attitude(v3pa)
+
+    def compute_attitude(self, v3pa):
+        """Compute attitude matrix given V3 position angle without modifying
+        the state of the object.
+
+        Parameters
+        ----------
+        v3pa : float
+            V3 position angle
+
+        Returns
+        -------
+        attitude : numpy.ndarray
+            3 x 3 attitude matrix
+        """
+        attitude = rotations.attitude(
             self.exposure_data["v2"],
             self.exposure_data["v3"],
             self.exposure_data["ra_center_rotation"],
@@ -739,6 +768,8 @@ class exposureFrames:
             v3pa,
         )
 
+        return attitude
+
     def check_in_susceptibility_region(self):
         """Method to check if stars from catalog are located in susceptibility
         region per angle of attitude. Angles are 0.0 --> 360.0 degrees in steps
@@ -758,7 +789,7 @@ class exposureFrames:
         "targets_in" : [True, True] or [False, True] ... [False, False]
         ```
         """
-        ra, dec = self.catalog["ra"], self.catalog["dec"]
+        ra, dec = self.catalog_ra, self.catalog_dec
         self.swept_angles = {}
 
         for obs_num, obs_data in self.data.items():
@@ -834,13 +865,28 @@ class exposureFrames:
             V2 position in degrees
         """
 
-        self.calculate_attitude(v3pa)
-        v2_radians, v3_radians = rotations.sky_to_tel(
-            self.attitude, ra_degrees, dec_degrees, verbose=verbose
+        attitude = self.compute_attitude(v3pa)
+
+        # Same transform as `pysiaf.utils.rotations.sky_to_tel` on plain
+        # arrays, avoiding astropy quantities for every angle of the sweep.
+        ra_radians = np.radians(ra_degrees)
+        dec_radians = np.radians(dec_degrees)
+        unit_vector_sky = np.array(
+            [
+                np.cos(ra_radians) * np.cos(dec_radians),
+                np.sin(ra_radians) * np.cos(dec_radians),
+                np.sin(dec_radians),
+            ]
         )
+        if verbose:
+            print("Sky-side unit vector: {}".format(unit_vector_sky))
+
+        unit_vector_tel = np.dot(attitude.T, unit_vector_sky)
+        if verbose:
+            print("Tel-side unit vector: {}".format(unit_vector_tel))
 
-        v2_degrees = v2_radians.value * 180.0 / np.pi
-        v3_degress = v3_radians.value * 180.0 / np.pi
+        v2_degrees = np.degrees(np.arctan2(unit_vector_tel[1], unit_vector_tel[0]))
+        v3_degress = np.degrees(np.arcsin(unit_vector_tel[2]))
 
         return v2_degrees, v3_degress
 
@@ -873,6 +919,7 @@ class susceptibilityRegion:
         self.get_intensity_map()
         self.V2V3path = self.get_path()
         self.calculate_centroid()
+        self.calculate_unit_vectors()
 
     def calculate_centroid(self):
         """Calculate the centroid of a susceptibility region polygons."""
@@ -883,6 +930,14 @@ class susceptibilityRegion:
             sum(vertices[:, 1]) / num_of_vertices,
         )
 
+    def calculate_unit_vectors(self):
+        """Calculate the unit vectors of the susceptibility region vertices in
+        the telescope frame. These only depend on the region geometry so they
+        are computed once and reused for every attitude.
+        """
+        v2, v3 = self.V2V3path.vertices.T
+        self.unit_vectors = unit_vectors_from_v2v3(v2, v3)
+
     def get_intensity_map(self):
         """Open intensity map reference file"""
         if self.module == "A":
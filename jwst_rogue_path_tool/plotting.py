@@ -12,15 +12,16 @@ Authors
     - Mees Fix
 """
 
-import astropy.units as u
-from astropy.coordinates import SkyCoord
-from matplotlib.patches import PathPatch, Wedge
+from concurrent.futures import ProcessPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import PathPatch
 from matplotlib.path import Path
 import matplotlib.pyplot as plt
 import numpy as np
-from pysiaf.utils import rotations
 
-from jwst_rogue_path_tool.utils import make_output_directory
+from jwst_rogue_path_tool.utils import make_output_directory, tel_to_sky_degrees
 
 
 def create_exposure_plots(observation, ra, dec, output_directory=None, **kwargs):
@@ -35,7 +36,9 @@ def create_exposure_plots(observation, ra, dec, output_directory=None, **kwargs)
         Declination in degrees
 
     **kwarg : dict
-        Arbitrary keyword arguements
+        Arbitrary keyword arguements. Setting ``processes`` to an integer
+        renders each exposure panel to an image in that many worker
+        processes and tiles the images into the figure.
     """
 
     plt.rcParams["figure.figsize"] = (20, 15)
@@ -43,6 +46,7 @@ def create_exposure_plots(observation, ra, dec, output_directory=None, **kwargs)
     inner_radius = kwargs.get("inner_radius", 8.0)
     outer_radius = kwargs.get("outer_radius", 12.0)
     ncols = kwargs.get("ncols", 4)
+    processes = kwargs.get("processes", None)
 
     wedge_length = inner_radius - 1
     exposure_frames = observation["exposure_frames"]
@@ -50,59 +54,84 @@ def create_exposure_plots(observation, ra, dec, output_directory=None, **kwargs)
 
     nrows = len(exposure_frames_data) // ncols + (len(exposure_frames_data) % ncols > 0)
 
-    catalog = exposure_frames.catalog
-    plotting_catalog = locate_targets_in_annulus(
-        catalog, ra, dec, inner_radius, outer_radius
+    plotting_catalog = get_plotting_catalog(
+        observation, ra, dec, inner_radius, outer_radius
     )
+    catalog_ra = plotting_catalog["ra"].to_numpy()
+    catalog_dec = plotting_catalog["dec"].to_numpy()
 
     obs_id = observation["visit"]["observation"].values[0]
     program = observation["nircam_templates"]["program"].values[0]
 
-    for n, exp_num in enumerate(exposure_frames_data):
+    # Exposures share many of the same valid angles, transform the
+    # susceptibility region once per unique angle and reuse it below.
+    valid_exposures = [
+        exp_num
+        for exp_num in exposure_frames_data
+        if exposure_frames.valid_starts_angles[exp_num] is not None
+    ]
+    region_vertices_by_angle = {}
+    if valid_exposures:
+        starts = np.concatenate(
+            [exposure_frames.valid_starts_angles[exp] for exp in valid_exposures]
+        )
+        ends = np.concatenate(
+            [exposure_frames.valid_ends_angles[exp] for exp in valid_exposures]
+        )
+        unique_angles = np.unique(np.concatenate([starts, ends]))
+        attitudes = np.stack(
+            [exposure_frames.compute_attitude(angle) for angle in unique_angles]
+        )
+        region_vertices = get_susceptibility_region_vertices(exposure_frames, attitudes)
+        region_vertices_by_angle = dict(zip(unique_angles.tolist(), region_vertices))
+
+    # Collect plain arrays for each panel so they can be drawn here or
+    # shipped to worker processes without the ExposureFrames object.
+    panels = []
+    for exp_num in exposure_frames_data:
         angle_start = exposure_frames.valid_starts_angles[exp_num]
         angle_end = exposure_frames.valid_ends_angles[exp_num]
 
-        ax = plt.subplot(nrows, ncols, n + 1)
-        ax.set_xlabel("RA [Degrees]")
-        ax.set_ylabel("DEC [Degrees]")
-        ax.set_title("Observation {}, Exposure: {}".format(obs_id, exp_num))
-        ax.scatter(ra, dec, marker="X", c="red")
-        ax.scatter(
-            plotting_catalog["ra"],
-            plotting_catalog["dec"],
-            c="deeppink",
-        )
-        ax.axis("equal")
-        ax.invert_xaxis()
-
         if angle_start is None and angle_end is None:
-            ax.annotate("NO VALID ANGLES", xy=(ra, dec))
+            angle_pairs = None
+            region_vertices = []
         else:
-            for angles in zip(angle_start, angle_end):
-                min_theta = (
-                    90.0 - angles[0]
-                )  # Origin of matplotlib is offset by 90 degrees
-                max_theta = (
-                    90.0 - angles[1]
-                )  # Origin of matplotlib is offset by 90 degrees
-                w = Wedge(
-                    (ra, dec),
-                    wedge_length,
-                    max_theta,
-                    min_theta,
-                    fill=False,
-                    color="darkseagreen",
-                    joinstyle="round",
-                )
-                ax.add_artist(w)
+            angle_pairs = np.unique(np.column_stack([angle_start, angle_end]), axis=0)
+            region_vertices = [
+                region_vertices_by_angle[float(angle)]
+                for angle in np.concatenate([angle_start, angle_end])
+            ]
+
+        panels.append(
+            {
+                "ra": ra,
+                "dec": dec,
+                "catalog_ra": catalog_ra,
+                "catalog_dec": catalog_dec,
+                "angle_pairs": angle_pairs,
+                "region_vertices": region_vertices,
+                "wedge_length": wedge_length,
+                "title": "Observation {}, Exposure: {}".format(obs_id, exp_num),
+            }
+        )
 
-            for angle in np.concatenate([angle_start, angle_end]):
-                exposure_frames.calculate_attitude(angle)
-                sus_region_patches = get_susceptibility_region_patch(
-                    exposure_frames, exp_num
-                )
-                for patch in sus_region_patches:
-                    ax.add_patch(patch)
+    if processes:
+        figsize = plt.rcParams["figure.figsize"]
+        tile_figsize = (figsize[0] / ncols, figsize[1] / nrows)
+        tile_dpi = plt.rcParams["figure.dpi"]
+        tiles = [(panel, tile_figsize, tile_dpi) for panel in panels]
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            images = list(executor.map(render_exposure_tile, tiles))
+
+        for n, image in enumerate(images):
+            ax = plt.subplot(nrows, ncols, n + 1)
+            ax.imshow(image)
+            ax.set_axis_off()
+    else:
+        for n, panel in enumerate(panels):
+            ax = plt.subplot(nrows, ncols, n + 1)
+            draw_exposure_panel(ax, **panel)
 
     plt.tight_layout()
 
@@ -118,6 +147,99 @@ def create_exposure_plots(observation, ra, dec, output_directory=None, **kwargs)
     plt.close()
 
 
+def draw_exposure_panel(
+    ax,
+    ra,
+    dec,
+    catalog_ra,
+    catalog_dec,
+    angle_pairs,
+    region_vertices,
+    wedge_length,
+    title,
+):
+    """Draw a single exposure panel of the exposure level plot.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes to draw the panel on.
+
+    ra : float
+        Right Ascension of the target in degrees
+
+    dec : float
+        Declination of the target in degrees
+
+    catalog_ra : numpy.ndarray
+        Right Ascension of catalog targets in degrees
+
+    catalog_dec : numpy.ndarray
+        Declination of catalog targets in degrees
+
+    angle_pairs : numpy.ndarray or None
+        Unique (start, end) valid angle pairs, None if there are no valid angles.
+
+    region_vertices : list
+        Susceptibility region vertices for each valid angle, see
+        `get_susceptibility_region_vertices`.
+
+    wedge_length : float
+        Radius of the valid angle wedges in degrees.
+
+    title : str
+        Title of the panel.
+    """
+    ax.set_xlabel("RA [Degrees]")
+    ax.set_ylabel("DEC [Degrees]")
+    ax.set_title(title)
+    ax.scatter(ra, dec, marker="X", c="red")
+    ax.scatter(catalog_ra, catalog_dec, c="deeppink")
+    ax.axis("equal")
+    ax.invert_xaxis()
+
+    if angle_pairs is None:
+        ax.annotate("NO VALID ANGLES", xy=(ra, dec))
+        return
+
+    # Origin of matplotlib is offset by 90 degrees
+    min_theta = 90.0 - angle_pairs[:, 0]
+    max_theta = 90.0 - angle_pairs[:, 1]
+    wedges = make_wedge_patch(ra, dec, wedge_length, max_theta, min_theta)
+    ax.add_artist(wedges)
+
+    for vertices in region_vertices:
+        for patch in make_susceptibility_region_patches(vertices):
+            ax.add_patch(patch)
+
+
+def render_exposure_tile(tile):
+    """Render a single exposure panel to an RGBA image off screen. Used as
+    the worker function when exposure panels are rendered in parallel.
+
+    Parameters
+    ----------
+    tile : tuple
+        Keyword arguments for `draw_exposure_panel`, figure size in
+        inches and dots per inch of the rendered image.
+
+    Returns
+    -------
+    image : numpy.ndarray
+        RGBA image of the panel with shape (height, width, 4).
+    """
+    panel, figsize, dpi = tile
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    draw_exposure_panel(ax, **panel)
+    fig.tight_layout()
+    canvas.draw()
+
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
 def create_observation_plot(observation, ra, dec, output_directory=None, **kwargs):
     """Plot that describe all valid angles at the observation level.
     The observation level plot is a single plot of all valid angles
@@ -146,17 +268,18 @@ def create_observation_plot(observation, ra, dec, output_directory=None, **kwarg
     observation_number = observation["nircam_templates"]["observation"].values[0]
     program = observation["nircam_templates"]["program"].values[0]
 
-    catalog = exposure_frames.catalog
-    plotting_catalog = locate_targets_in_annulus(
-        catalog, ra, dec, inner_radius, outer_radius
+    plotting_catalog = get_plotting_catalog(
+        observation, ra, dec, inner_radius, outer_radius
     )
+    catalog_ra = plotting_catalog["ra"].to_numpy()
+    catalog_dec = plotting_catalog["dec"].to_numpy()
 
     ax = plt.subplot()
     ax.set_xlabel("RA [Degrees]")
     ax.set_ylabel("DEC [Degrees]")
     ax.set_title(f"Program {program} Observation {observation_number}")
     ax.scatter(ra, dec, marker="X", c="red")
-    ax.scatter(plotting_catalog["ra"], plotting_catalog["dec"], c="deeppink")
+    ax.scatter(catalog_ra, catalog_dec, c="deeppink")
 
     ax.axis("equal")
     ax.invert_xaxis()
@@ -167,19 +290,15 @@ def create_observation_plot(observation, ra, dec, output_directory=None, **kwarg
     if all_starting_angles.size == 0 and all_ending_angles.size == 0:
         ax.annotate("NO VALID ANGLES", xy=(ra, dec))
     else:
-        for angles in zip(all_starting_angles, all_ending_angles):
-            min_theta = 90.0 - angles[0]  # Origin of matplotlib is offset by 90 degrees
-            max_theta = 90.0 - angles[1]  # Origin of matplotlib is offset by 90 degrees
-            w = Wedge(
-                (ra, dec),
-                wedge_length,
-                max_theta,
-                min_theta,
-                fill=False,
-                color="darkseagreen",
-                joinstyle="round",
-            )
-            ax.add_artist(w)
+        # Keep starting and ending angles paired while removing duplicates.
+        angle_pairs = np.unique(
+            np.column_stack([all_starting_angles, all_ending_angles]), axis=0
+        )
+        # Origin of matplotlib is offset by 90 degrees
+        min_theta = 90.0 - angle_pairs[:, 0]
+        max_theta = 90.0 - angle_pairs[:, 1]
+        wedges = make_wedge_patch(ra, dec, wedge_length, max_theta, min_theta)
+        ax.add_artist(wedges)
 
     plt.tight_layout()
     if output_directory:
@@ -194,7 +313,51 @@ def create_observation_plot(observation, ra, dec, output_directory=None, **kwarg
     plt.close()
 
 
-def get_susceptibility_region_patch(exposure_frames, exposure_id):
+def get_plotting_catalog(observation, ra, dec, inner_radius, outer_radius):
+    """Obtain the catalog targets that fall in the annulus around the target.
+    The selection is stored on the observation so the exposure and
+    observation level plots only calculate it once.
+
+    Parameters
+    ----------
+    observation : dictionary
+        Dictionary of a single observation dataset
+
+    ra : float
+        Right Ascension in degrees
+
+    dec : float
+        Declination in degrees
+
+    inner_radius : float
+        Inner radius of annulus
+
+    outer_radius : float
+        Outer area of annulus
+
+    Returns
+    -------
+    plotting_catalog : pandas.core.frame.DataFrame
+        Catalog targets within the annulus.
+    """
+    plotting_catalogs = observation.setdefault("plotting_catalogs", {})
+    key = (ra, dec, inner_radius, outer_radius)
+
+    if key not in plotting_catalogs:
+        exposure_frames = observation["exposure_frames"]
+        catalog_mask = locate_targets_in_annulus(
+            exposure_frames.catalog_trig,
+            ra,
+            dec,
+            inner_radius,
+            outer_radius,
+        )
+        plotting_catalogs[key] = exposure_frames.catalog[catalog_mask]
+
+    return plotting_catalogs[key]
+
+
+def get_susceptibility_region_patch(exposure_frames, exposure_id, attitude):
     """Obtain data for susceptibility region and generate plottable
     patch.
 
@@ -202,40 +365,94 @@ def get_susceptibility_region_patch(exposure_frames, exposure_id):
     ----------
     exposure_frames : jwst_rogue_path_tool.detect_claws.ExposureFrames
         ExposureFrame object associated with observation.
+
+    exposure_id : int
+        Exposure id number
+
+    attitude : numpy.ndarray
+        3 x 3 attitude matrix, see `ExposureFrames.compute_attitude`
     """
-    patches = []
+    region_vertices = get_susceptibility_region_vertices(
+        exposure_frames, attitude[np.newaxis]
+    )
+    patches = make_susceptibility_region_patches(region_vertices[0])
+
+    return patches
 
+
+def get_susceptibility_region_vertices(exposure_frames, attitudes):
+    """Transform the susceptibility region vertices to RA and Dec for a
+    set of attitudes. The vertices of every module are rotated by every
+    attitude matrix in a single batched operation.
+
+    Parameters
+    ----------
+    exposure_frames : jwst_rogue_path_tool.detect_claws.ExposureFrames
+        ExposureFrame object associated with observation.
+
+    attitudes : numpy.ndarray
+        Stack of attitude matrices with shape (number of attitudes, 3, 3)
+
+    Returns
+    -------
+    region_vertices : list
+        For each attitude, a list of (ra_deg, dec_deg, codes) tuples, one
+        per module.
+    """
     region = exposure_frames.susceptibility_region
+    modules = [region[key] for key in region]
+
+    # Stack the precomputed telescope frame unit vectors of all modules.
+    unit_vectors = np.concatenate([module.unit_vectors for module in modules], axis=1)
+    split_indices = np.cumsum([module.unit_vectors.shape[1] for module in modules])
+
+    # Rotate to the sky for every attitude and convert back to RA and Dec.
+    ra_deg, dec_deg = tel_to_sky_degrees(attitudes, unit_vectors)
+
+    region_vertices = []
+    for ra_attitude, dec_attitude in zip(ra_deg, dec_deg):
+        region_vertices.append(
+            [
+                (ra_module, dec_module, module.V2V3path.codes)
+                for ra_module, dec_module, module in zip(
+                    np.split(ra_attitude, split_indices[:-1]),
+                    np.split(dec_attitude, split_indices[:-1]),
+                    modules,
+                )
+            ]
+        )
 
-    for key in region:
-        module = region[key]
-        attitude = exposure_frames.attitude
+    return region_vertices
 
-        v2 = 3600 * module.V2V3path.vertices.T[0]  # degrees --> arcseconds
-        v3 = 3600 * module.V2V3path.vertices.T[1]  # degrees --> arcseconds
 
-        ra_rads, dec_rads = rotations.tel_to_sky(
-            attitude, v2, v3
-        )  # returns ra and dec in radians
-        ra_deg, dec_deg = (
-            ra_rads * 180.0 / np.pi,
-            dec_rads * 180.0 / np.pi,
-        )  # convert to degrees
+def make_susceptibility_region_patches(region_vertices):
+    """Build plottable patches from transformed susceptibility region vertices.
+    Patches can only belong to a single axis, so new patches are made on
+    every call.
 
-        ra_dec_path = Path(np.array([ra_deg, dec_deg]).T, module.V2V3path.codes)
+    Parameters
+    ----------
+    region_vertices : list
+        List of (ra_deg, dec_deg, codes) tuples from
+        `get_susceptibility_region_vertices`.
+    """
+    patches = []
+
+    for ra_deg, dec_deg, codes in region_vertices:
+        ra_dec_path = Path(np.array([ra_deg, dec_deg]).T, codes)
         ra_dec_patch = PathPatch(ra_dec_path, lw=2, alpha=0.1)
         patches.append(ra_dec_patch)
 
     return patches
 
 
-def locate_targets_in_annulus(catalog, ra, dec, inner_radius, outer_radius):
+def locate_targets_in_annulus(catalog_trig, ra, dec, inner_radius, outer_radius):
     """Calculate the targets from a catalog that fall within inner and outer radii.
 
     Parameters
     ----------
-    catalog : pandas.core.frame.DataFrame
-        DataFrame of star positions and magnitudes from 2MASS
+    catalog_trig : jwst_rogue_path_tool.utils.catalogTrig
+        Precomputed catalog positions, see `jwst_rogue_path_tool.utils.get_catalog_trig`
 
     ra : float
         Right Ascension in degrees
@@ -248,24 +465,69 @@ def locate_targets_in_annulus(catalog, ra, dec, inner_radius, outer_radius):
 
     outer_radius : float
         Outer area of annulus
+
+    Returns
+    -------
+    mask : numpy.ndarray
+        Boolean mask of catalog targets that fall within the annulus.
     """
 
-    # Set coordinates for target and catalog
-    target_coordinates = SkyCoord(ra * u.deg, dec * u.deg, frame="icrs")
-    catalog_coordinates = SkyCoord(
-        catalog["ra"].values * u.deg,
-        catalog["dec"].values * u.deg,
-        frame="icrs",
+    # Compare the cosine of the angular separation against the cosine of the
+    # annulus radii rather than building SkyCoord objects, cos decreases
+    # monotonically with separation so the inequalities are flipped.
+    ra_target = np.radians(ra)
+    dec_target = np.radians(dec)
+    sin_dec_target = np.sin(dec_target)
+    cos_dec_target = np.cos(dec_target)
+
+    cos_separation = catalog_trig.sin_dec * sin_dec_target + (
+        catalog_trig.cos_dec
+        * cos_dec_target
+        * np.cos(catalog_trig.ra_radians - ra_target)
     )
+    mask = (cos_separation > np.cos(np.radians(outer_radius))) & (
+        cos_separation < np.cos(np.radians(inner_radius))
+    )
+
+    return mask
 
-    # Calculate separation from target to all targets in catalog
-    separation = target_coordinates.separation(catalog_coordinates)
-    mask = (separation.deg < outer_radius) & (separation.deg > inner_radius)
 
-    # Retrieve all targets in masked region above.
-    plotting_catalog = catalog[mask]
+def make_wedge_patch(ra, dec, wedge_length, theta1, theta2):
+    """Build the valid angle wedges as a single patch. Wedges are drawn
+    counterclockwise from `theta1` to `theta2` like `matplotlib.patches.Wedge`
+    but all of them are combined into one compound path and drawn as one
+    artist.
+
+    Parameters
+    ----------
+    ra : float
+        Right Ascension of wedge center in degrees
+
+    dec : float
+        Declination of wedge center in degrees
+
+    wedge_length : float
+        Radius of wedges
 
-    return plotting_catalog
+    theta1 : list like
+        Starting angles of wedges in degrees
+
+    theta2 : list like
+        Ending angles of wedges in degrees
+
+    Returns
+    -------
+    wedges : matplotlib.patches.PathPatch
+        Patch containing the outlines of all wedges.
+    """
+    unit_wedges = [Path.wedge(start, end) for start, end in zip(theta1, theta2)]
+    unit_path = Path.make_compound_path(*unit_wedges)
+
+    # Scale and move all of the unit wedges at once.
+    wedge_path = Path(unit_path.vertices * wedge_length + [ra, dec], unit_path.codes)
+    wedges = PathPatch(wedge_path, fill=False, color="darkseagreen", joinstyle="round")
+
+    return wedges
 
 
 def plot_fixed_angle_regions(observation, angle, output_directory=None):
@@ -288,8 +550,14 @@ def plot_fixed_angle_regions(observation, angle, output_directory=None):
     number_of_modules = len(susceptibility_region)
     modules_name = observation["nircam_templates"]["modules"].values[0]
 
-    plt.set_cmap("magma")
-    fig, ax = plt.subplots(number_of_modules, figsize=(15, 15))
+    if output_directory:
+        # The figure is only saved, build it outside of pyplot so it is not
+        # registered with (and kept alive by) the pyplot figure manager.
+        fig = Figure(figsize=(15, 15))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots(number_of_modules)
+    else:
+        fig, ax = plt.subplots(number_of_modules, figsize=(15, 15))
 
     # Hack for the loop below to work with a program that contains
     # a single module (A or B) or both modules (A and B).
@@ -306,7 +574,7 @@ def plot_fixed_angle_regions(observation, angle, output_directory=None):
         avg_v3 = averages[f"avg_v3_{module}"]
         avg_intensity = averages[f"avg_intensity_{module}"]
 
-        im = ax.scatter(avg_v2, avg_v3, c=avg_intensity)
+        im = ax.scatter(avg_v2, avg_v3, c=avg_intensity, cmap="magma")
         fig.colorbar(im, ax=ax, label="Intensity")
 
         # Make box around centroid of centroid of susceptibility region.
@@ -327,11 +595,10 @@ def plot_fixed_angle_regions(observation, angle, output_directory=None):
         filename = f"{program}_{observation_number}_{modules_name}_{angle}.png"
         make_output_directory(full_path)
         print(f"WRITING FIGURE TO {full_path / filename}")
-        plt.savefig(full_path / filename)
+        fig.savefig(full_path / filename)
     else:
         plt.show(fig)
-
-    plt.close(fig)
+        plt.close(fig)
 
 
 def create_v3pa_vs_flux_plot(observation, output_directory=None, fontsize=15):
@@ -351,13 +618,20 @@ def create_v3pa_vs_flux_plot(observation, output_directory=None, fontsize=15):
     observation_number = observation["nircam_templates"]["observation"].values[0]
     program_id = observation["visit"]["program"].values[0]
     susceptibility_regions = observation["exposure_frames"].susceptibility_region
-    modules = susceptibility_regions.keys()
+    modules = list(susceptibility_regions)
     filters = observation["filters"]
     pupils = observation["pupils"]
 
     flux = observation["flux"]["dn_pix_ks"]
     flux_boolean = observation["flux_boolean"]
 
+    # Build the flux and threshold dictionary keys for every panel up front.
+    flux_keys = [
+        [f"dn_pix_ks_{pupil}+{filter}_{module}" for module in modules]
+        for filter, pupil in zip(filters, pupils)
+    ]
+    boolean_keys = [[f"{filter}_{module}" for module in modules] for filter in filters]
+
     colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
 
     fig, axes = plt.subplots(
@@ -379,21 +653,35 @@ def create_v3pa_vs_flux_plot(observation, output_directory=None, fontsize=15):
     )
 
     for mod, module in enumerate(modules):
-        for fltr, (filter, pupil) in enumerate(zip(filters, pupils)):
-            flux_key = f"dn_pix_ks_{pupil}+{filter}_{module}"
-            flux_values = flux[flux_key]
+        for fltr, filter in enumerate(filters):
+            flux_values = flux[flux_keys[fltr][mod]]
             axes[fltr, mod].plot(flux_values)
-            above_threshold = np.copy(flux_values)
 
-            for color_idx, key in enumerate(flux_boolean[f"{filter}_{module}"].keys()):
-                stats_function, lam_threshold, bkg_threshold = key.split("_")
-                above_threshold[
+            thresholds = [
+                key.split("_") for key in flux_boolean[boolean_keys[fltr][mod]].keys()
+            ]
+
+            # Thresholds are applied cumulatively, each line masks the values
+            # flagged by its own threshold and all of the previous ones.
+            masks = np.stack(
+                [
                     flux_boolean[f"flux_boolean_{stats_function}_{module}"]
-                ] = np.nan
-                label_str = f"{eval(bkg_threshold):.1f} x {stats_function} = {eval(lam_threshold):.1f} DN/pix/ks"
+                    for stats_function, _, _ in thresholds
+                ]
+            )
+            masks = np.logical_or.accumulate(masks, axis=0)
+            above_thresholds = np.where(masks, np.nan, flux_values[np.newaxis, :])
+
+            for color_idx, (threshold, above_threshold) in enumerate(
+                zip(thresholds, above_thresholds)
+            ):
+                stats_function, lam_threshold, bkg_threshold = threshold
+                lam_threshold = float(lam_threshold)
+                bkg_threshold = float(bkg_threshold)
+                label_str = f"{bkg_threshold:.1f} x {stats_function} = {lam_threshold:.1f} DN/pix/ks"
                 axes[fltr, mod].plot(above_threshold, c=colors[color_idx + 1])
                 axes[fltr, mod].axhline(
-                    eval(lam_threshold),
+                    lam_threshold,
                     c=colors[color_idx + 1],
                     ls="--",
                     label=label_str,
@@ -414,7 +702,9 @@ def create_v3pa_vs_flux_plot(observation, output_directory=None, fontsize=15):
         if len(modules) > 1:
             filename = f"v3pa_vs_flux_{program_id}_{observation_number}_ALL.png"
         else:
-            filename = f"v3pa_vs_flux_{program_id}_{observation_number}_{module}.png"
+            filename = (
+                f"v3pa_vs_flux_{program_id}_{observation_number}_{modules[0]}.png"
+            )
 
         full_path = output_directory / str(program_id) / "v3pa_vs_flux"
         make_output_directory(full_path)
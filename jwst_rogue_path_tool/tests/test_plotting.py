@@ -0,0 +1,121 @@
+"""Test `jwst_rogue_path_tool.plotting` module.
+
+Authors
+-------
+    - Mees Fix
+"""
+
+from types import SimpleNamespace
+
+from astropy.coordinates import SkyCoord
+import astropy.units as u
+import numpy as np
+import pandas as pd
+from pysiaf.utils import rotations
+import pytest
+
+from jwst_rogue_path_tool.detect_claws import susceptibilityRegion
+from jwst_rogue_path_tool.plotting import (
+    get_susceptibility_region_vertices,
+    locate_targets_in_annulus,
+    make_wedge_patch,
+    render_exposure_tile,
+)
+from jwst_rogue_path_tool.utils import get_catalog_trig
+
+
+@pytest.mark.parametrize(
+    "ra, dec",
+    [
+        (124.0, 19.2),
+        (0.5, -45.0),
+        (359.5, 85.0),
+    ],
+)
+def test_locate_targets_in_annulus(ra, dec):
+    rng = np.random.default_rng(1234)
+    catalog = pd.DataFrame(
+        {
+            "ra": rng.uniform(0.0, 360.0, 5000),
+            "dec": np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, 5000))),
+        }
+    )
+
+    catalog_trig = get_catalog_trig(catalog["ra"].to_numpy(), catalog["dec"].to_numpy())
+    mask = locate_targets_in_annulus(catalog_trig, ra, dec, 8.0, 12.0)
+
+    separation = (
+        SkyCoord(ra * u.deg, dec * u.deg)
+        .separation(
+            SkyCoord(catalog["ra"].values * u.deg, catalog["dec"].values * u.deg)
+        )
+        .deg
+    )
+    expected = (separation < 12.0) & (separation > 8.0)
+
+    assert expected.any()
+    np.testing.assert_array_equal(mask, expected)
+
+
+@pytest.mark.parametrize("angles", [[0.0], [10.5, 123.0, 359.0]])
+def test_get_susceptibility_region_vertices(angles):
+    region = {
+        "A": susceptibilityRegion(module="A"),
+        "B": susceptibilityRegion(module="B"),
+    }
+    exposure_frames = SimpleNamespace(susceptibility_region=region)
+    attitudes = np.stack(
+        [rotations.attitude(-0.5, -7.0, 124.0, 19.2, angle) for angle in angles]
+    )
+
+    region_vertices = get_susceptibility_region_vertices(exposure_frames, attitudes)
+
+    assert len(region_vertices) == len(angles)
+    for attitude, vertices in zip(attitudes, region_vertices):
+        for (ra_deg, dec_deg, codes), module in zip(vertices, region.values()):
+            v2, v3 = 3600 * module.V2V3path.vertices.T
+            expected_ra, expected_dec = rotations.tel_to_sky(attitude, v2, v3)
+            np.testing.assert_allclose(ra_deg, expected_ra.to_value(u.deg))
+            np.testing.assert_allclose(dec_deg, expected_dec.to_value(u.deg))
+            np.testing.assert_array_equal(codes, module.V2V3path.codes)
+
+
+@pytest.mark.parametrize(
+    "theta1, theta2, inside, outside",
+    [
+        (10.0, 40.0, 25.0, 55.0),
+        (350.0, 20.0, 5.0, 180.0),
+        (40.0, 10.0, 180.0, 25.0),
+    ],
+)
+def test_make_wedge_patch(theta1, theta2, inside, outside):
+    wedges = make_wedge_patch(124.0, 19.2, 7.0, [theta1, 200.0], [theta2, 210.0])
+    path = wedges.get_path()
+
+    def point(angle):
+        angle = np.radians(angle)
+        return 124.0 + 3.5 * np.cos(angle), 19.2 + 3.5 * np.sin(angle)
+
+    assert path.contains_point(point(inside))
+    assert path.contains_point(point(205.0))
+    assert not path.contains_point(point(outside))
+
+
+@pytest.mark.parametrize("angle_pairs", [None, np.array([[10.0, 40.0]])])
+def test_render_exposure_tile(angle_pairs):
+    panel = {
+        "ra": 124.0,
+        "dec": 19.2,
+        "catalog_ra": np.array([130.0, 118.0]),
+        "catalog_dec": np.array([19.0, 21.0]),
+        "angle_pairs": angle_pairs,
+        "region_vertices": [],
+        "wedge_length": 7.0,
+        "title": "Observation 1, Exposure: 1",
+    }
+
+    image = render_exposure_tile((panel, (4.0, 3.0), 50))
+
+    assert image.shape == (150, 200, 4)
+    assert image.dtype == np.uint8
+    assert (image[..., :3] < 255).any()
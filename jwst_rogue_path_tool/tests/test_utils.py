@@ -5,9 +5,17 @@ Authors
     - Mees Fix
 """
 
+import astropy.units as u
+import numpy as np
+from pysiaf.utils import rotations
 import pytest
 
-from jwst_rogue_path_tool.utils import absolute_magnitude, get_pivot_wavelength
+from jwst_rogue_path_tool.utils import (
+    absolute_magnitude,
+    get_pivot_wavelength,
+    tel_to_sky_degrees,
+    unit_vectors_from_v2v3,
+)
 
 
 @pytest.mark.parametrize(
@@ -34,3 +42,16 @@ def test_absolute_magnitude(magnitude, expected):
 def test_get_pivot_wavelength(pupil, filter, expected):
     pivot_wavelength = get_pivot_wavelength(pupil, filter)
     pivot_wavelength == expected
+
+
+@pytest.mark.parametrize("v3pa", [0.0, 45.0, 180.0, 359.0])
+def test_tel_to_sky_degrees(v3pa):
+    v2 = np.array([-1.0, -0.5, 0.0, 0.25, 1.5])
+    v3 = np.array([-8.0, -7.5, -6.0, -9.0, -7.0])
+    attitude = rotations.attitude(-0.5, -7.0, 124.0, 19.2, v3pa)
+
+    ra, dec = tel_to_sky_degrees(attitude, unit_vectors_from_v2v3(v2, v3))
+    expected_ra, expected_dec = rotations.tel_to_sky(attitude, 3600 * v2, 3600 * v3)
+
+    np.testing.assert_allclose(ra, expected_ra.to_value(u.deg))
+    np.testing.assert_allclose(dec, expected_dec.to_value(u.deg))
@@ -7,6 +7,8 @@ Authors
     - Mees Fix
 """
 
+from collections import namedtuple
+
 from jwst_backgrounds import jbt
 import numpy as np
 import pandas as pd
@@ -14,6 +16,8 @@ import pathlib
 
 from jwst_rogue_path_tool.constants import PROJECT_DIRNAME
 
+catalogTrig = namedtuple("catalogTrig", ["ra_radians", "sin_dec", "cos_dec"])
+
 
 def absolute_magnitude(band_magnitude):
     """Calculate absolute magnitude from band magnitude.
@@ -54,6 +58,34 @@ def calculate_background(ra, dec, wavelength, threshold):
     return background_data
 
 
+def get_catalog_trig(ra_degrees, dec_degrees):
+    """Precompute the catalog quantities used in angular separation
+    calculations so they can be reused for every target.
+
+    Parameters
+    ----------
+    ra_degrees : numpy.ndarray
+        Right Ascension of catalog targets in degrees
+
+    dec_degrees : numpy.ndarray
+        Declination of catalog targets in degrees
+
+    Returns
+    -------
+    catalog_trig : catalogTrig
+        Named tuple of contiguous arrays (ra_radians, sin_dec, cos_dec)
+    """
+    dec_radians = np.radians(dec_degrees)
+
+    catalog_trig = catalogTrig(
+        ra_radians=np.ascontiguousarray(np.radians(ra_degrees)),
+        sin_dec=np.ascontiguousarray(np.sin(dec_radians)),
+        cos_dec=np.ascontiguousarray(np.cos(dec_radians)),
+    )
+
+    return catalog_trig
+
+
 def get_pupil_from_filter(filters):
     """Given a NRC filter, return list of available filters
 
@@ -117,6 +149,65 @@ def get_pivot_wavelength(pupil, filter):
     return pivot_wavelength
 
 
+def tel_to_sky_degrees(attitude, unit_vectors):
+    """Rotate telescope frame unit vectors onto the sky. Equivalent to
+    `pysiaf.utils.rotations.tel_to_sky` without the astropy quantity overhead
+    and accepting a stack of attitude matrices.
+
+    Parameters
+    ----------
+    attitude : numpy.ndarray
+        Attitude matrix with shape (3, 3) or stack of attitude matrices with
+        shape (number of attitudes, 3, 3)
+
+    unit_vectors : numpy.ndarray
+        Telescope frame unit vectors with shape (3, number of vertices), see
+        `unit_vectors_from_v2v3`
+
+    Returns
+    -------
+    ra_degrees : numpy.ndarray
+        Right Ascension in degrees [0, 360)
+
+    dec_degrees : numpy.ndarray
+        Declination in degrees
+    """
+    sky_vectors = np.einsum("...ij,jv->...iv", attitude, unit_vectors)
+
+    ra_degrees = (
+        np.degrees(np.arctan2(sky_vectors[..., 1, :], sky_vectors[..., 0, :])) % 360.0
+    )
+    dec_degrees = np.degrees(np.arcsin(sky_vectors[..., 2, :]))
+
+    return ra_degrees, dec_degrees
+
+
+def unit_vectors_from_v2v3(v2_degrees, v3_degrees):
+    """Convert V2/V3 positions to unit vectors in the telescope frame.
+
+    Parameters
+    ----------
+    v2_degrees : numpy.ndarray
+        V2 positions in degrees
+
+    v3_degrees : numpy.ndarray
+        V3 positions in degrees
+
+    Returns
+    -------
+    unit_vectors : numpy.ndarray
+        Unit vectors with shape (3, number of positions)
+    """
+    v2 = np.radians(v2_degrees)
+    v3 = np.radians(v3_degrees)
+
+    unit_vectors = np.array(
+        [np.cos(v2) * np.cos(v3), np.sin(v2) * np.cos(v3), np.sin(v3)]
+    )
+
+    return unit_vectors
+
+
 def make_output_directory(directory_name):
     """Make output directories for figures and text files.
 